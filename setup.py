@@ -1,11 +1,43 @@
+import os
+
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
+with open("readme.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional: compile the analyzer with Cython (pure Python mode, no .pyx
+# needed) by building with FARAHEEDY_COMPILE=1. Cython must be importable by
+# this script, so build with --no-build-isolation after installing it; pip's
+# isolated build environment only has the [build-system] requirements. The
+# extension is optional: if it fails to compile (e.g. no C compiler) the
+# install carries on with the pure Python module, which is always shipped.
+ext_modules = []
+if os.environ.get("FARAHEEDY_COMPILE") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise SystemExit(
+            "FARAHEEDY_COMPILE=1 needs Cython in the build environment: "
+            "pip install cython, then build with --no-build-isolation"
+        )
+
+    ext_modules = cythonize(
+        ["al_faraheedy/main.py"],
+        language_level=3,
+        compiler_directives={
+            # Keep annotations as hints so the compiled module accepts
+            # exactly what the pure Python one does
+            "annotation_typing": False,
+            "infer_types": True,
+            "boundscheck": False,
+        },
+    )
+    for ext in ext_modules:
+        ext.optional = True
+
 setup(
     name="Al-Faraheedy-Python",
     version="1.0.0",
@@ -60,6 +92,7 @@ setup(
             "faraheedy=al_faraheedy.cli:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "al_faraheedy": ["data/*.json", "data/*.txt"],
@@ -0,0 +1,47 @@
+import pickle
+
+from al_faraheedy import ArabicPoetryAnalyzer
+
+VERSE = 'على قدْر أهْل العزْم تأْتي العزائمُ'
+
+
+def test_batch_results_are_independent_copies():
+    analyzer = ArabicPoetryAnalyzer()
+    first, second = analyzer.analyze_classical_verses_batch([VERSE, VERSE], is_ajez=True)
+    assert first == second
+    assert first['tafa3eel']
+    expected = list(first['tafa3eel'])
+
+    first['tafa3eel'].append('????')
+    first['ba7er_name'] = 'edited'
+
+    assert second['tafa3eel'] == expected
+    again = analyzer.analyze_classical_verse(VERSE, True)
+    assert again['tafa3eel'] == expected
+    assert again['ba7er_name'] == second['ba7er_name']
+    assert analyzer.analyze_classical_verses_batch([VERSE], is_ajez=True) == [second]
+
+
+def test_clear_caches_empties_every_cache():
+    analyzer = ArabicPoetryAnalyzer()
+    analyzer.analyze_classical_verse(VERSE, True)
+    analyzer.analyze_rhyme_patterns([VERSE, VERSE])
+    assert analyzer._analyse_classical.cache_info().currsize > 0
+
+    analyzer.clear_caches()
+
+    for name in analyzer.CACHED_METHODS:
+        assert getattr(analyzer, name).cache_info().currsize == 0, name
+
+
+def test_pickling_drops_and_rebuilds_caches():
+    analyzer = ArabicPoetryAnalyzer()
+    expected = analyzer.analyze_classical_verse(VERSE, True)
+
+    restored = pickle.loads(pickle.dumps(analyzer))
+    for name in restored.CACHED_METHODS:
+        assert getattr(restored, name).cache_info().currsize == 0, name
+    assert restored.analyze_classical_verse(VERSE, True) == expected
+
+    analyze = pickle.loads(pickle.dumps(analyzer.analyze_classical_verse))
+    assert analyze(VERSE, True) == expected
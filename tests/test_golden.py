@@ -0,0 +1,879 @@
+"""
+Golden outputs of the public analyses, recorded from the original
+implementation. The optimised text normalisation, meter DFA, foot
+splitters and eshbaa3 search must keep reproducing them exactly.
+"""
+
+import dataclasses
+
+import pytest
+
+from al_faraheedy import ArabicPoetryAnalyzer
+
+# (verse, is_ajez, analyze_classical_verse result)
+CLASSICAL = [
+    (
+        "ما بيْن مفْترقٍ و مفْترقِ",
+        True,
+        {
+            "shater": "مابيْنمفْترقنْومفْترقِيْ",
+            "arrodi": "مابيْنمفْترقنْومفْترقِيْ",
+            "chars": "مابينمفترقنومفترقي",
+            "harakat": "ََََََََََََْْْْْْ",
+            "rokaz": "--U-UU-U-UU-",
+            "ba7er_name": "o7othKamel",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "ممْلوْءةٌ بمقاتليْ طرقيْ",
+        True,
+        {
+            "shater": "ممْلوْءتُنْبمقاتليْطرقيْ",
+            "arrodi": "ممْلوْءتُنْبمقاتليْطرقيْ",
+            "chars": "مملوءتنبمقاتليطرقي",
+            "harakat": "ََََََََََََْْْْْْ",
+            "rokaz": "--U-UU-U-UU-",
+            "ba7er_name": "o7othKamel",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "أنّى التفتّ و حيْثما ضبحتْ",
+        True,
+        {
+            "shater": "أنْنتْتفتْتوحيْثماضبحتْ",
+            "arrodi": "أنْنتْتفتْتوحيْثماضبحتْ",
+            "chars": "أننتتفتتوحيثماضبحت",
+            "harakat": "ََََََََََََْْْْْْ",
+            "rokaz": "--U-UU-U-UU-",
+            "ba7er_name": "o7othKamel",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "خيْليْ أجدْ رأْسيْ على طبقِ",
+        True,
+        {
+            "shater": "خيْليْأجدْرأْسيْعلىطبقِيْ",
+            "arrodi": "خيْليْأجدْرأْسيْعلىطبقِيْ",
+            "chars": "خيليأجدرأسيعلىطبقي",
+            "harakat": "َََََََََََْْْْْْْ",
+            "rokaz": "--U---U-UU-",
+            "ba7er_name": "madeed",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "فوْق الرِّماحِ أرى أعاديهُ",
+        True,
+        {
+            "shater": "فوْقرْرِماحِأرىأعاديهُوْ",
+            "arrodi": "فوْقرْرِماحِأرىأعاديهُوْ",
+            "chars": "فوقررماحأرىأعاديهو",
+            "harakat": "ََََََََََََْْْْْْ",
+            "rokaz": "--U-UU-U-UU-",
+            "ba7er_name": "o7othKamel",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "حملوْهُ مفْغوْر الفم الدبقِ",
+        True,
+        {
+            "shater": "حملوْهُمفْغوْرلْفمدْدبقِيْ",
+            "arrodi": "حملوْهُمفْغوْرلْفمدْدبقِيْ",
+            "chars": "حملوهمفغورلفمددبقي",
+            "harakat": "ََََََََََََْْْْْْ",
+            "rokaz": "UU-U---U-UU-",
+            "ba7er_name": "madeed",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "دمهُ يقطّر و هْو يلْعنهمْ",
+        True,
+        {
+            "shater": "دمهُيقطْطروهْويلْعنهمْ",
+            "arrodi": "دمهُيقطْطروهْويلْعنهمْ",
+            "chars": "دمهيقططروهويلعنهم",
+            "harakat": "َََََََََََََْْْْ",
+            "rokaz": "UUUU-UU-U-UU-",
+            "ba7er_name": "munsare7",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "لوْ كنْتُ منْ ماءٍ للمْ أرقِ",
+        True,
+        {
+            "shater": "لوْكنْتُمنْماءنْللْمْأرقِيْ",
+            "arrodi": "لوْكنْتُمنْماءنْللْمْأرقِيْ",
+            "chars": "لوكنتمنماءنللمأرقي",
+            "harakat": "ََََََََََْْْْْْْْ",
+            "rokaz": "--U----UUU-",
+            "ba7er_name": "majzoo2Munsare7",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "على قدْر أهْل العزْم تأْتي العزائمُ",
+        True,
+        {
+            "shater": "علىقدْرأهْللْعزْمتأْتلْعزائمُوْ",
+            "arrodi": "علىقدْرأهْللْعزْمتأْتلْعزائمُوْ",
+            "chars": "علىقدرأهللعزمتأتلعزائمو",
+            "harakat": "ََََََََََََََْْْْْْْْْ",
+            "rokaz": "U--U---U--U-U-",
+            "ba7er_name": "taweel",
+            "tafa3eel": [
+                "فَعُوْلُنْ",
+                "على قدرأهلل",
+                "مَفَاْعِيْلُنْ",
+                "عزمتأتلعزائمو",
+                "فَعُوْلُنْ",
+                "",
+                "مَفَاْعِلُنْ",
+                "",
+            ],
+        },
+    ),
+    (
+        "متى منْ طوْل نزْفك تسْتريْحُ",
+        True,
+        {
+            "shater": "متىمنْطوْلنزْفكتسْتريْحُوْ",
+            "arrodi": "متىمنْطوْلنزْفكتسْتريْحُوْ",
+            "chars": "متىمنطولنزفكتستريحو",
+            "harakat": "ََََََََََََْْْْْْْ",
+            "rokaz": "U---U-UU-U--",
+            "ba7er_name": "wafer",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "أرحْ قمْح غيّابٍ يجافوْن منْجلكْ",
+        True,
+        {
+            "shater": "أرحْقمْحغيْيابنْيجافوْنمنْجلكْ",
+            "arrodi": "أرحْقمْحغيْيابنْيجافوْنمنْجلكْ",
+            "chars": "أرحقمحغييابنيجافونمنجلك",
+            "harakat": "ََََََََََََََْْْْْْْْْ",
+            "rokaz": "U--U---U--U-U-",
+            "ba7er_name": "taweel",
+            "tafa3eel": [
+                "فَعُوْلُنْ",
+                "أرحقمحغييا",
+                "مَفَاْعِيْلُنْ",
+                "بنيجافونمنجلك",
+                "فَعُوْلُنْ",
+                "",
+                "مَفَاْعِلُنْ",
+                "",
+            ],
+        },
+    ),
+    (
+        "تمهّل و لا تمْتحنّيْ بما لا أطيْقُ",
+        True,
+        {
+            "shater": "تمهْهلولاتمْتحنْنيْبمالاأطيْقُوْ",
+            "arrodi": "تمهْهلولاتمْتحنْنيْبمالاأطيْقُوْ",
+            "chars": "تمههلولاتمتحننيبمالاأطيقو",
+            "harakat": "ََََََََََََََََْْْْْْْْْ",
+            "rokaz": "U-UUU--U--U--U--",
+            "ba7er_name": "mutakareb",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "عَلَى قَدْرِ أَهْلِ الْعَزْمِ تَأْتِي الْعَزَائِمُ",
+        True,
+        {
+            "shater": "عَلَىقَدْرِأَهْلِالْعَزْمِتَأْتِيالْعَزَائِمُوْ",
+            "arrodi": "عَلَىقَدْرِأَهْلِالْعَزْمِتَأْتِيالْعَزَائِمُوْ",
+            "chars": "علىقدرأهلالعزمتأتيالعزائمو",
+            "harakat": "َََََََََََََََْْْْْْْْْْْ",
+            "rokaz": "U--U--U-U-U-UU-U-",
+            "ba7er_name": "majzoo2Saree3",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَتَأْتِي عَلَى قَدْرِ الْكِرَامِ الْمَكَارِمُ",
+        True,
+        {
+            "shater": "وَتَأْتِيعَلَىقَدْرِالْكِرَامِالْمَكَارِمُوْ",
+            "arrodi": "وَتَأْتِيعَلَىقَدْرِالْكِرَامِالْمَكَارِمُوْ",
+            "chars": "وتأتيعلىقدرالكرامالمكارمو",
+            "harakat": "َََََََََََََََْْْْْْْْْْ",
+            "rokaz": "U-UUU---UU--UU-U-",
+            "ba7er_name": "majzoo2Mutadarak",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَتَعْظُمُ فِي عَيْنِ الصَّغِيرِ صِغَارُهَا",
+        True,
+        {
+            "shater": "وَتَعْظُمُفِيعَيْنِصْصَغِيرِصِغَارُهَاوْ",
+            "arrodi": "وَتَعْظُمُفِيعَيْنِصْصَغِيرِصِغَارُهَاوْ",
+            "chars": "وتعظمفيعينصصغيرصغارهاو",
+            "harakat": "ََََََََََََََََْْْْْْ",
+            "rokaz": "U-UUUU--UUUUU-U-U",
+            "ba7er_name": "manhookRajaz",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَنَحْنُ نُحِبُّ الحَيَاةَ إذَا مَا اسْتَطَعْنَا إِلَيْهَا سَبِيلاَ",
+        True,
+        {
+            "shater": "وَنَحْنُنُحِبُلْحَيَاةَإذَامَسْتَطَعْنَاإِلَيْهَاسَبِيلاَاْ",
+            "arrodi": "وَنَحْنُنُحِبُلْحَيَاةَإذَامَسْتَطَعْنَاإِلَيْهَاسَبِيلاَاْ",
+            "chars": "ونحننحبلحياةإذامستطعناإليهاسبيلاا",
+            "harakat": "َََََََََََََََََََََََْْْْْْْْْْ",
+            "rokaz": "U-UUU-U-UU--U--U--UUUU-",
+            "ba7er_name": "mutakareb",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَنَرْقُصُ بَيْنَ شَهِيدْينِ نَرْفَعُ مِئْذَنَةً لِلْبَنَفْسَجِ بَيْنَهُمَا أَوْ نَخِيلاَ",
+        True,
+        {
+            "shater": "وَنَرْقُصُبَيْنَشَهِيدْينِنَرْفَعُمِئْذَنَتَنْلِلْبَنَفْسَجِبَيْنَهُمَاأَوْنَخِيلاَاْ",
+            "arrodi": "وَنَرْقُصُبَيْنَشَهِيدْينِنَرْفَعُمِئْذَنَتَنْلِلْبَنَفْسَجِبَيْنَهُمَاأَوْنَخِيلاَاْ",
+            "chars": "ونرقصبينشهيديننرفعمئذنتنللبنفسجبينهماأونخيلاا",
+            "harakat": "َََََََََََََََََََََََََََََََََْْْْْْْْْْْْ",
+            "rokaz": "U-UU-UUU-UU-UU-UU--U-UU-UU--UUUU-",
+            "ba7er_name": "mutakareb",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَنَسْرِقُ مِنْ دُودَةِ القَزِّ خَيْطاً لِنَبْنِي سَمَاءً لَنَا وَنُسَيِّجَ هَذَا الرَّحِيلاَ",
+        True,
+        {
+            "shater": "وَنَسْرِقُمِنْدُودَةِلْقَزِخَيْطنْلِنَبْنِيسَمَاءنْلَنَاوَنُسَيِجَهَاذَرْرَحِيلاَاْ",
+            "arrodi": "وَنَسْرِقُمِنْدُودَةِلْقَزِخَيْطنْلِنَبْنِيسَمَاءنْلَنَاوَنُسَيِجَهَاذَرْرَحِيلاَاْ",
+            "chars": "ونسرقمندودةلقزخيطنلنبنيسماءنلناونسيجهاذررحيلاا",
+            "harakat": "ََََََََََََََََََََََََََََََََََْْْْْْْْْْْْ",
+            "rokaz": "U-UU-UUU-UU--U-UUU--U-UUUUU--UUUU-",
+            "ba7er_name": "saree3",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "وَنَكْتُبُ أَسْمَاءَنَا حَجَراً ’ أَيُّهَا البَرْقُ أَوْضِحْ لَنَا اللَّيْلَ ’ أَوْضِحْ قَلِيلاَ",
+        True,
+        {
+            "shater": "وَنَكْتُبُأَسْمَاءَنَاحَجَرنْأَيُهَلْبَرْقُأَوْضِحْلَنَلْلَيْلَأَوْضِحْقَلِيلاَاْ",
+            "arrodi": "وَنَكْتُبُأَسْمَاءَنَاحَجَرنْأَيُهَلْبَرْقُأَوْضِحْلَنَلْلَيْلَأَوْضِحْقَلِيلاَاْ",
+            "chars": "ونكتبأسماءناحجرنأيهلبرقأوضحلنلليلأوضحقليلاا",
+            "harakat": "َََََََََََََََََََََََََََََْْْْْْْْْْْْْْ",
+            "rokaz": "U-UU--U-UU-UU--U--U--U--UUUU-",
+            "ba7er_name": "mutakareb",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "ما بيْن مفْترقٍ و مفْترقِ",
+        False,
+        {
+            "shater": "مابيْنمفْترقنْومفْترقِ",
+            "arrodi": "مابيْنمفْترقنْومفْترقِ",
+            "chars": "مابينمفترقنومفترق",
+            "harakat": "ََََََََََََْْْْْ",
+            "rokaz": "--U-UU-U-UUU",
+            "ba7er_name": "majzoo2Kamel",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "على قدْر أهْل العزْم تأْتي العزائمُ",
+        False,
+        {
+            "shater": "علىقدْرأهْللْعزْمتأْتلْعزائمُ",
+            "arrodi": "علىقدْرأهْللْعزْمتأْتلْعزائمُ",
+            "chars": "علىقدرأهللعزمتأتلعزائم",
+            "harakat": "ََََََََََََََْْْْْْْْ",
+            "rokaz": "U--U---U--U-UU",
+            "ba7er_name": "madeed",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "عَلَى قَدْرِ أَهْلِ الْعَزْمِ تَأْتِي الْعَزَائِمُ",
+        False,
+        {
+            "shater": "عَلَىقَدْرِأَهْلِالْعَزْمِتَأْتِيالْعَزَائِمُ",
+            "arrodi": "عَلَىقَدْرِأَهْلِالْعَزْمِتَأْتِيالْعَزَائِمُ",
+            "chars": "علىقدرأهلالعزمتأتيالعزائم",
+            "harakat": "َََََََََََََََْْْْْْْْْْ",
+            "rokaz": "U--U--U-U-U-UU-UU",
+            "ba7er_name": "majzoo2Saree3",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "قذجْ !ثٍة !كهؤلاء !عٌعبُحفطّ !ءٌىؤى !العٌدِسْمُ !ب !ثُضهُ !هؤلاء ",
+        False,
+        {
+            "shater": "قذجْثنْةكهَاؤُلَاءعنْعبُحفطْطءنْىؤلْعنْدِسْمُبثُضهُهَاؤُلَاء",
+            "arrodi": "قذجْثنْةكهَاؤُلَاءعنْعبُحفطْطءنْىؤلْعنْدِسْمُبثُضهُهَاؤُلَاء",
+            "chars": "قذجثنةكهاؤلاءعنعبحفططءنىؤلعندسمبثضههاؤلاء",
+            "harakat": "ََََََََََََََََََََََََََََْْْْْْْْْْْْْ",
+            "rokaz": "U--UU-U-U-UUU-U-U---UUUUU-U-U",
+            "ba7er_name": "rajaz",
+            "tafa3eel": [
+                "????",
+                "قذ",
+                "????",
+                "جث",
+                "مُسْتَعِلُنْ",
+                "نة كهاؤلاءعنع",
+                "مُتَفْعِلُنْ",
+                "بحفططءنى ؤلعن",
+                "مُتَعِلُنْ",
+                "دسمبثضههاؤ",
+                "مُتَفْعِلُنْ",
+                "لاء",
+                "????",
+                "",
+                "????",
+                "",
+                "????",
+                "",
+                "????",
+                "",
+                "مُتَعِلُنْ",
+                "",
+                "????",
+                "",
+                "????",
+                "",
+                "????",
+                "",
+            ],
+        },
+    ),
+    (
+        "فعُضًاٍوَازًآّ  غًئّةٍفَثْإ  للقىضذّق  لكنّ  ى  آمن  غحةٍرتإٌإ",
+        False,
+        {
+            "shater": "فعُضنْانْوَازنْأاْاغنْئْئتِنْفَثْإللْقىضذْذقلَاْكِنْنَىأامنغحتِنْرتإنْإ",
+            "arrodi": "فعُضنْانْوَازنْأاْاغنْئْئتِنْفَثْإللْقىضذْذقلَاْكِنْنَىأامنغحتِنْرتإنْإ",
+            "chars": "فعضنانوازنأااغنئئتنفثإللقىضذذقلاكننىأامنغحتنرتإنإ",
+            "harakat": "َََََََََََََََََََََََََََََْْْْْْْْْْْْْْْْْْْْ",
+            "rokaz": "UU-UU---U-UU--U---UU----UUUU-UU-U",
+            "ba7er_name": "taweel",
+            "tafa3eel": [
+                "مَفَاْعِيْلُنْ",
+                "فعضنانوازنأااغ",
+                "فَعُوْلُنْ",
+                "نئئتنفثإلل",
+            ],
+        },
+    ),
+    (
+        " ومُحّتًيِكهٍ) !أٍئ !غّظثْىٍءٍاً !وّ",
+        False,
+        {
+            "shater": "ومُحْحتنْيِكهنْأنْئغْغظثْىنْءنْنْوْو",
+            "arrodi": "ومُحْحتنْيِكهنْأنْئغْغظثْىنْءنْنْوْو",
+            "chars": "ومححتنيكهنأنئغغظثىنءننوو",
+            "harakat": "َََََََََََََْْْْْْْْْْْ",
+            "rokaz": "U-U-UU---U-UU-UUU",
+            "ba7er_name": "baseet",
+            "tafa3eel": [
+                "مُتَفْعِلُنْ",
+                "ومححتنيكهنأن",
+                "فَعِلُنْ",
+                "ئغغظثى نء",
+                "مُسْتَفْعِلُنْ",
+                "ننوو",
+            ],
+        },
+    ),
+    (
+        "  آٍؤُ صشتًشْ رٌخْقةٌ الرحمن امرؤ",
+        True,
+        {
+            "shater": "أانْؤُصشتنْشْرنْخْقتُنْرْرَحْمانمْرؤوْ",
+            "arrodi": "أانْؤُصشتنْشْرنْخْقتُنْرْرَحْمانمْرؤوْ",
+            "chars": "أانؤصشتنشرنخقتنررحمانمرؤو",
+            "harakat": "َََََََََََََْْْْْْْْْْْْ",
+            "rokaz": "-UUUU-U-UU-U---U-",
+            "ba7er_name": "kamel",
+            "tafa3eel": [
+                "????",
+                "أا",
+                "????",
+                "نؤ",
+                "????",
+                "صش",
+                "مُتَفَاْعِلُنْ",
+                "تنشرنخقتنررحما",
+                "مُتَفَاْعِلُنْ",
+                "نمرؤو",
+                "مُسْتَفْعِلُنْ",
+                "",
+            ],
+        },
+    ),
+    (
+        "اللهُهِ ",
+        False,
+        {
+            "shater": "#لْلهُهِيْ#",
+            "arrodi": "لْلهُهِيْ",
+            "chars": "للههي",
+            "harakat": "َََْْ",
+            "rokaz": "UUU-",
+            "ba7er_name": "manhookRajaz",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "ظًىة بهِ",
+        False,
+        {
+            "shater": "#ظنْىة#بهِيْ#",
+            "arrodi": "ظنْىةبهِيْ",
+            "chars": "ظنىةبهي",
+            "harakat": "ََََْْْ",
+            "rokaz": "-UUU-",
+            "ba7er_name": "manhookRajaz",
+            "tafa3eel": [],
+        },
+    ),
+    (
+        "هؤلاء # بهِ",
+        False,
+        {
+            "shater": "#هَاؤُلَاء#بهِيْ#",
+            "arrodi": "هَاؤُلَاءبهِيْ",
+            "chars": "هاؤلاءبهي",
+            "harakat": "ََََََْْْ",
+            "rokaz": "-U-UU-",
+            "ba7er_name": "manhookRajaz",
+            "tafa3eel": [],
+        },
+    ),
+]
+
+# (text, analyze_free_verse result)
+FREE_VERSE = [
+    (
+        "متى منْ طوْل نزْفك تسْتريْحُ",
+        {
+            "ba7er": "wafer",
+            "tafa3eel": ["U", "-", "-", "-", "U", "-", "U", "U", "-", "U", "-", "U"],
+            "names": [
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+            ],
+            "words": [
+                "مت",
+                "ى م",
+                "نط",
+                "ول",
+                "نز",
+                "فك",
+                "تس",
+                "تر",
+                "يح",
+                "",
+                "",
+                "",
+            ],
+        },
+    ),
+    (
+        "وَنَكْتُبُ أَسْمَاءَنَا حَجَراً ’ أَيُّهَا البَرْقُ أَوْضِحْ لَنَا اللَّيْلَ ’ أَوْضِحْ قَلِيلاَ",
+        {
+            "ba7er": "mutakareb",
+            "tafa3eel": [
+                "U-U",
+                "U--",
+                "U-U",
+                "U-U",
+                "U--",
+                "U--",
+                "U--",
+                "U--",
+                "U",
+                "U",
+                "U",
+                "U",
+                "U",
+            ],
+            "names": [
+                "فَعُوْلُ",
+                "فَعُوْلُنْ",
+                "فَعُوْلُ",
+                "فَعُوْلُ",
+                "فَعُوْلُنْ",
+                "فَعُوْلُنْ",
+                "فَعُوْلُنْ",
+                "فَعُوْلُنْ",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+            ],
+            "words": [
+                "ونكتبأسم",
+                "اءناحجرنأي",
+                "هلبرقأوض",
+                "حلنلليلأ",
+                "وضحقليلا",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+            ],
+        },
+    ),
+    (
+        "للرحمن ظّقِ",
+        {
+            "ba7er": "hazaj",
+            "tafa3eel": ["U", "-", "-", "-", "U", "U"],
+            "names": ["????", "????", "????", "????", "????", "????"],
+            "words": ["لر", "حم", "ان", "ظظ", "ق", ""],
+        },
+    ),
+    (
+        "كتاباًةٌ # رَصجٍئنٌآٍسً # تُقِفُي # امرؤوا # فالقمر",
+        {
+            "ba7er": "wafer",
+            "tafa3eel": [
+                "U",
+                "-",
+                "-",
+                "-",
+                "U",
+                "U",
+                "-",
+                "U",
+                "-",
+                "-",
+                "U",
+                "-",
+                "U",
+                "U",
+                "-",
+                "U",
+                "-",
+                "-",
+                "U",
+                "U",
+                "U",
+            ],
+            "names": [
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+            ],
+            "words": [
+                "كت",
+                "اب",
+                "نت",
+                "نر",
+                "صج",
+                "نئ",
+                "نن",
+                "أا",
+                "نس",
+                "نت",
+                "قف",
+                "مر",
+                "ؤو",
+                "فل",
+                "قم",
+                "ر",
+                "",
+                "",
+                "",
+                "",
+                "",
+            ],
+        },
+    ),
+    (
+        " ىوّظاٌبٌ - اًيّءٍ - حْخٌقثغْوِ - وٌىًاً - ىُقٌءغدذّ - قاهِكٍذٌتٌطُّ",
+        {
+            "ba7er": "rajaz",
+            "tafa3eel": [
+                "UUU-",
+                "U",
+                "-",
+                "UUU-",
+                "U-U-",
+                "U",
+                "-",
+                "UUU-",
+                "U",
+                "U-U-",
+                "U",
+                "-",
+                "-",
+                "-",
+                "U",
+            ],
+            "names": [
+                "مُتَعِلُنْ",
+                "????",
+                "????",
+                "مُتَعِلُنْ",
+                "مُتَفْعِلُنْ",
+                "????",
+                "????",
+                "مُتَعِلُنْ",
+                "????",
+                "مُتَفْعِلُنْ",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+            ],
+            "words": [
+                "ى ووظانبنني",
+                "يء",
+                "نح",
+                "خنقثغووننن",
+                "ى قنءغدذذقاهك",
+                "نذ",
+                "نت",
+                "نط",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+            ],
+        },
+    ),
+    (
+        "هذانةٌ الذي هؤلاء ذٍإْيٌجُثٌ فهِ بالةً والصصُطوطوا",
+        {
+            "ba7er": "mutakareb",
+            "tafa3eel": [
+                "U-U",
+                "-",
+                "U",
+                "U--",
+                "U-U",
+                "-",
+                "U-U",
+                "-",
+                "U",
+                "U-U",
+                "-",
+                "-",
+                "U",
+                "U",
+                "U",
+                "U",
+                "U-",
+            ],
+            "names": [
+                "فَعُوْلُ",
+                "????",
+                "????",
+                "فَعُوْلُنْ",
+                "فَعُوْلُ",
+                "????",
+                "فَعُوْلُ",
+                "????",
+                "????",
+                "فَعُوْلُ",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "????",
+                "فَعُوْ",
+            ],
+            "words": [
+                "هذانتنلل",
+                "ذي",
+                "ها",
+                "ؤلاءذنإينج",
+                "ثنفهبالت",
+                "نو",
+                "الصصطوطو",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+                "",
+            ],
+        },
+    ),
+]
+
+# analyze_rhyme_patterns of the first twelve verses, as field tuples
+RHYMES = [
+    ("ففْترققِييْ", "قافية مطلقة مجرَّدة", "ي", "يْ", "", "", "", "", None),
+    ("ييْطرقييْ", "قافية مطلقة مجرَّدة", "ي", "يْ", "", "", "", "", []),
+    (
+        "ماضبحتتْ",
+        "قافية مقيّدة مجرَّدة",
+        "تْ",
+        "",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    ("لىطبققِييْ", "قافية مطلقة مجرَّدة", "ي", "يْ", "", "", "", "", []),
+    (
+        "عاديههُووْ",
+        "قافية مطلقة مجرَّدة",
+        "و",
+        "وْ",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    ("ددْدبققِييْ", "قافية مطلقة مجرَّدة", "ي", "يْ", "", "", "", "", []),
+    (
+        "للْعنهممْ",
+        "قافية مقيّدة مجرَّدة",
+        "مْ",
+        "",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    ("للْممْأرققِييْ", "قافية مطلقة مجرَّدة", "ي", "يْ", "", "", "", "", []),
+    (
+        "زائممُووْ",
+        "قافية مطلقة مجرَّدة",
+        "و",
+        "وْ",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    (
+        "ييْححُووْ",
+        "قافية مطلقة مجرَّدة",
+        "و",
+        "وْ",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    (
+        "ننْجلككْ",
+        "قافية مقيّدة مجرَّدة",
+        "كْ",
+        "",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+    (
+        "ييْققُووْ",
+        "قافية مطلقة مجرَّدة",
+        "و",
+        "وْ",
+        "",
+        "",
+        "",
+        "",
+        [
+            "قافية هذا البيت مختلفة كليَّاً عن قافية القصيدة و ذلك <b>لاختلاف الرَّويِّ</b> بين القافيتين."
+        ],
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return ArabicPoetryAnalyzer()
+
+
+@pytest.mark.parametrize("verse, is_ajez, expected", CLASSICAL)
+def test_classical_verse(analyzer, verse, is_ajez, expected):
+    assert analyzer.analyze_classical_verse(verse, is_ajez) == expected
+
+
+@pytest.mark.parametrize("text, expected", FREE_VERSE)
+def test_free_verse(analyzer, text, expected):
+    assert analyzer.analyze_free_verse(text) == expected
+
+
+def test_rhyme_patterns(analyzer):
+    verses = [verse for verse, *_ in CLASSICAL[:12]]
+    results = analyzer.analyze_rhyme_patterns(verses)
+    assert [dataclasses.astuple(result) for result in results] == RHYMES
@@ -0,0 +1,73 @@
+import itertools
+import random
+import sys
+import threading
+
+from al_faraheedy.main import ArabicPoetryAnalyzer, _MeterDFA
+
+METER_PATTERNS = ArabicPoetryAnalyzer.METER_PATTERNS
+
+
+def first_matching_meter(rokaz):
+    """The meter _get_ba7er reports: the first pattern matching anywhere"""
+    for name, pattern in METER_PATTERNS.items():
+        if pattern.search(rokaz):
+            return name
+    return 'unknown'
+
+
+def random_rokaz(rng, count):
+    return [
+        ''.join(rng.choice('U-' if rng.random() < 0.97 else 'U-x') for _ in range(rng.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+def test_matches_search_on_all_short_rokaz():
+    dfa = _MeterDFA(METER_PATTERNS)
+    for length in range(15):
+        for symbols in itertools.product('U-', repeat=length):
+            rokaz = ''.join(symbols)
+            assert dfa.match(rokaz) == first_matching_meter(rokaz), rokaz
+
+
+def test_matches_search_on_long_and_unexpected_rokaz():
+    dfa = _MeterDFA(METER_PATTERNS)
+    for rokaz in random_rokaz(random.Random(0), 5000):
+        assert dfa.match(rokaz) == first_matching_meter(rokaz), rokaz
+
+
+def test_shared_automaton_agrees_with_search():
+    dfa = ArabicPoetryAnalyzer.METER_DFA
+    for rokaz in random_rokaz(random.Random(1), 2000):
+        assert dfa.match(rokaz) == first_matching_meter(rokaz), rokaz
+
+
+def test_concurrent_building():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        dfa = _MeterDFA(METER_PATTERNS)
+        data = random_rokaz(random.Random(2), 3000)
+        failures = []
+
+        def worker(offset):
+            try:
+                for rokaz in data[offset::8]:
+                    if dfa.match(rokaz) != first_matching_meter(rokaz):
+                        failures.append(rokaz)
+            except Exception as error:  # Reported as a failure below
+                failures.append(repr(error))
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert failures == []
+    # The table built concurrently must be sound for later callers as well
+    for rokaz in data:
+        assert dfa.match(rokaz) == first_matching_meter(rokaz), rokaz